@@ -10,12 +10,15 @@ This script interacts with the Portainer API to manage Docker containers and sta
 
 Functions:
 - `authenticate()`: Authenticates with the Portainer API and returns a JWT token.
+- `get_jwt()`: Returns a JWT token, reusing a cached one while it is still valid.
 - `start_container(jwt_token, container_id)`: Starts a Docker container using its ID.
+- `wait_ready(jwt_token, container_id)`: Polls a container until it reports ready.
 - `fetch_logs(jwt_token, container_id)`: Retrieves logs for a specified container.
 - `send_notification(subject, message)`: Sends notifications (e.g., using the dynamic-notification-system).
 - `create_container_from_compose(jwt_token, compose_file_content)`: Creates a new stack from Docker Compose content.
 - `get_stacks(jwt_token)`: Fetches all stacks in the Portainer instance.
 - `get_stack_containers(jwt_token, stack_id)`: Fetches all containers in a specific stack.
+- `list_all_containers(jwt_token)`: Fetches every container on the endpoint in one call.
 
 Main Scheduler:
 - Authenticates with the API.
@@ -25,7 +28,9 @@ Main Scheduler:
 
 Dependencies:
 - `requests`: For making HTTP requests to the API.
-- `json`: For handling JSON payloads.
+- `orjson`: For fast parsing of API responses.
+- `cachetools`: For short-lived caching of listing endpoints.
+- `json`: For handling small local JSON files.
 - `time`: For adding delays during container startup.
 
 Note:
@@ -33,10 +38,34 @@ Replace placeholders like `PORTAINER_URL`, `USERNAME`, `PASSWORD`, and `ENDPOINT
 """
 import requests
 import time
-import json 
+import json
+import orjson
+import os
+import base64
+import mmap
+import tempfile
+import threading
+import logging
+import logging.handlers
+import queue
+from collections import defaultdict
+from urllib.parse import urlencode
+from cachetools import TTLCache, cached
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 # DEBUG var ( turn off in Production )
-DEBUG = True 
+DEBUG = True
+
+# Log through a background queue: worker threads enqueue records instead of
+# serializing on blocking TTY writes, and a listener thread drains them.
+_log_queue = queue.Queue(-1)
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler())
+_log_listener.start()
+log = logging.getLogger("kratos")
+log.addHandler(logging.handlers.QueueHandler(_log_queue))
+log.setLevel(logging.DEBUG if DEBUG else logging.INFO)
 
 # Portainer API details
 PORTAINER_URL = "http://your-portainer-instance:9000/api"   # change this
@@ -48,6 +77,101 @@ PASSWORD = "password"                                       # change this
 # for example Master Portainer ID 1
 ENDPOINT_ID=1                                               # change this
 
+# Stable URL prefixes, built once instead of re-formatted on every call
+CONTAINERS_URL = f"{PORTAINER_URL}/endpoints/{ENDPOINT_ID}/docker/containers"
+STACKS_URL = f"{PORTAINER_URL}/stacks"
+
+# Number of worker threads used to fetch container logs in parallel
+MAX_WORKERS = 16
+
+# Number of trailing log lines to request per container (trimmed server-side)
+LOG_TAIL_LINES = 200
+
+# Per-container shared-memory ring buffers holding the newest log bytes;
+# bounds memory per container no matter how large a log delta arrives
+LOG_RING_BYTES = 1 << 20  # 1 MiB
+LOG_RING_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else tempfile.gettempdir()
+
+# Notification sink (dynamic-notification-system); None disables notifications
+NOTIFY_URL = None                                           # change this, e.g. "http://localhost:8080/notify"
+NOTIFY_BATCH_SIZE = 32
+
+# Shared HTTP session: keeps TCP/TLS connections alive across API calls and
+# lets the worker threads share one connection pool instead of paying a
+# handshake per request. The pool is sized to the worker count and blocks
+# rather than opening throwaway sockets, so concurrent fetches never exceed
+# MAX_WORKERS connections to the Portainer host.
+SESSION = requests.Session()
+SESSION.headers.update({
+    "Accept": "application/json",
+    # Ask for compressed bodies; requests decompresses transparently, and the
+    # streaming log path decodes chunk by chunk so memory stays bounded.
+    "Accept-Encoding": "gzip, deflate",
+})
+# Retry transient failures (reloading Portainer, network hiccups) with
+# backoff instead of aborting the whole run on the first 502.
+_retry = Retry(
+    total=5,
+    backoff_factor=0.3,
+    status_forcelist=(429, 502, 503, 504),
+    allowed_methods=frozenset(["GET", "POST"]),
+    respect_retry_after_header=True,
+)
+SESSION.mount("http://", HTTPAdapter(max_retries=_retry, pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, pool_block=True))
+SESSION.mount("https://", HTTPAdapter(max_retries=_retry, pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, pool_block=True))
+
+# Short-lived response caches for the read-only listing endpoints: repeated
+# calls within the TTL hit a dict lookup instead of the network. 30 s is safe
+# for "list what exists" data; both caches are cleared when a stack is created.
+_stacks_cache = TTLCache(maxsize=64, ttl=30)
+_containers_cache = TTLCache(maxsize=64, ttl=30)
+
+# On-disk JWT cache so repeated runs (e.g. from cron) skip the /auth round trip
+JWT_CACHE_FILE = os.path.expanduser("~/.cache/kratos_jwt.json")
+
+# Per-container timestamp of the last successful log fetch, persisted across
+# runs so fetch_logs only asks Portainer for lines written since the previous
+# run instead of re-downloading the whole log every time.
+LOG_OFFSETS_FILE = os.path.expanduser("~/.cache/kratos_log_offsets.json")
+_log_offsets = None
+_log_offsets_lock = threading.Lock()
+
+def _get_log_offset(container_id):
+    """
+    Returns the unix timestamp of the last successful log fetch for a container.
+
+    Args:
+        container_id (str): ID of the container.
+
+    Returns:
+        int: Timestamp of the last fetch, or 0 if the container is unknown.
+    """
+    global _log_offsets
+    with _log_offsets_lock:
+        if _log_offsets is None:
+            try:
+                with open(LOG_OFFSETS_FILE) as f:
+                    _log_offsets = json.load(f)
+            except (OSError, ValueError):
+                _log_offsets = {}
+        return _log_offsets.get(container_id, 0)
+
+def _set_log_offset(container_id, timestamp):
+    """
+    Records the timestamp of a successful log fetch and flushes it to disk.
+
+    Args:
+        container_id (str): ID of the container.
+        timestamp (int): Unix timestamp of the fetch.
+    """
+    with _log_offsets_lock:
+        _log_offsets[container_id] = timestamp
+        os.makedirs(os.path.dirname(LOG_OFFSETS_FILE), exist_ok=True)
+        tmp_file = LOG_OFFSETS_FILE + ".tmp"
+        with open(tmp_file, "w") as f:
+            json.dump(_log_offsets, f)
+        os.replace(tmp_file, LOG_OFFSETS_FILE)  # atomic, same as the JWT cache
+
 # Authenticate with Portainer
 def authenticate():
     """
@@ -58,9 +182,45 @@ def authenticate():
     """
     url = f"{PORTAINER_URL}/auth"
     payload = {"Username": USERNAME, "Password": PASSWORD}
-    response = requests.post(url, json=payload, timeout=10)
+    response = SESSION.post(url, json=payload, timeout=10)
     response.raise_for_status()
-    return response.json()["jwt"]
+    jwt_token = orjson.loads(response.content)["jwt"]
+    # Authorize the shared session once; every later call inherits the header.
+    SESSION.headers["Authorization"] = f"Bearer {jwt_token}"
+    return jwt_token
+
+# Get a JWT token, reusing a cached one when still valid
+def get_jwt():
+    """
+    Returns a JWT token, reusing the cached token from disk while it is still valid.
+
+    Portainer JWTs are valid for hours, so re-authenticating on every run wastes
+    a full password-grant round trip. The token's `exp` claim is decoded from the
+    payload segment and the cached token is reused as long as it has more than a
+    minute of validity left; otherwise a fresh token is fetched and cached.
+
+    Returns:
+        str: JWT token for further API requests.
+    """
+    try:
+        with open(JWT_CACHE_FILE) as f:
+            jwt_token = json.load(f)["jwt"]
+        payload = jwt_token.split('.')[1]
+        payload += "=" * (-len(payload) % 4)  # restore stripped base64 padding
+        exp = json.loads(base64.urlsafe_b64decode(payload))["exp"]
+        if exp - time.time() > 60:
+            SESSION.headers["Authorization"] = f"Bearer {jwt_token}"
+            return jwt_token
+    except (OSError, ValueError, KeyError, IndexError):
+        pass  # missing/corrupt cache: fall through and authenticate
+
+    jwt_token = authenticate()
+    os.makedirs(os.path.dirname(JWT_CACHE_FILE), exist_ok=True)
+    tmp_file = JWT_CACHE_FILE + ".tmp"
+    with open(tmp_file, "w") as f:
+        json.dump({"jwt": jwt_token}, f)
+    os.replace(tmp_file, JWT_CACHE_FILE)  # atomic so a crash can't corrupt the cache
+    return jwt_token
 
 # Schedule a container to start
 def start_container(jwt_token, container_id):
@@ -71,50 +231,149 @@ def start_container(jwt_token, container_id):
         jwt_token (str): JWT token for authorization.
         container_id (str): ID of the container to start.
     """
-    url = f"{PORTAINER_URL}/endpoints/{ENDPOINT_ID}/docker/containers/{container_id}/start"
-    headers = {"Authorization": f"Bearer {jwt_token}"}
-    response = requests.post(url, headers=headers)
+    url = f"{CONTAINERS_URL}/{container_id}/start"
+    response = SESSION.post(url)
     response.raise_for_status()
-    print(f"Container {container_id} started successfully.")
+    log.info(f"Container {container_id} started successfully.")
+
+# Wait for a started container to become ready
+def wait_ready(jwt_token, container_id, timeout=30):
+    """
+    Polls a container until it reports ready, with exponential backoff.
+
+    A container is considered ready when its health check reports "healthy",
+    or when it is running and defines no health check. Polling starts at
+    50 ms and backs off to at most 500 ms, so a container that is up within
+    a couple of seconds is detected almost immediately instead of waiting
+    out a fixed sleep.
+
+    Args:
+        jwt_token (str): JWT token for authorization.
+        container_id (str): ID of the container to wait for.
+        timeout (int): Maximum number of seconds to wait.
+
+    Returns:
+        bool: True if the container became ready within the timeout.
+    """
+    url = f"{CONTAINERS_URL}/{container_id}/json"
+    deadline = time.monotonic() + timeout
+    delay = 0.05
+    while time.monotonic() < deadline:
+        response = SESSION.get(url)
+        response.raise_for_status()
+        state = orjson.loads(response.content)["State"]
+        health = state.get("Health", {}).get("Status")
+        if health == "healthy" or (state.get("Running") and health is None):
+            return True
+        time.sleep(delay)
+        delay = min(delay * 2, 0.5)
+    return False
 
 # Fetch container logs
-def fetch_logs(jwt_token, container_id):
+def fetch_logs(jwt_token, container_id, tail=LOG_TAIL_LINES):
     """
     Retrieves logs for a specified container.
 
+    The log is trimmed server-side via `tail` and the body is streamed in
+    fixed-size chunks into a per-container mmap'd ring buffer under
+    LOG_RING_DIR, so peak memory stays bounded at LOG_RING_BYTES even for
+    very chatty containers and the newest bytes always win. Only lines
+    written since the previous successful fetch are requested (`since=`),
+    with the per-container offsets persisted across runs.
+
     Args:
         jwt_token (str): JWT token for authorization.
         container_id (str): ID of the container whose logs are to be fetched.
+        tail (int): Number of trailing log lines to request from the server.
 
     Returns:
         str: Logs from the container.
     """
-    url = f"{PORTAINER_URL}/endpoints/{ENDPOINT_ID}/docker/containers/{container_id}/logs?stdout=true&stderr=true"
-    headers = {"Authorization": f"Bearer {jwt_token}"}
-    response = requests.get(url, headers=headers)
+    since = _get_log_offset(container_id)
+    fetch_ts = int(time.time())
+    url = f"{CONTAINERS_URL}/{container_id}/logs?stdout=true&stderr=true&tail={tail}&since={since}&timestamps=true"
+    response = SESSION.get(url, stream=True)
     response.raise_for_status()
-    return response.text
+
+    # Stream the body into a per-container mmap'd ring file: the newest
+    # LOG_RING_BYTES survive, older bytes are overwritten in place, and the
+    # ring doubles as an on-disk record of the last forwarded log slice.
+    ring_path = os.path.join(LOG_RING_DIR, f"kratos-{container_id}.log")
+    with open(ring_path, "a+b") as ring_file:
+        ring_file.truncate(LOG_RING_BYTES)
+        with mmap.mmap(ring_file.fileno(), LOG_RING_BYTES) as ring:
+            wpos = 0
+            total = 0
+            for chunk in response.iter_content(chunk_size=64 * 1024, decode_unicode=False):
+                chunk = chunk[-LOG_RING_BYTES:]  # only the newest ring-sized slice can survive
+                end = wpos + len(chunk)
+                if end <= LOG_RING_BYTES:
+                    ring[wpos:end] = chunk
+                else:
+                    split = LOG_RING_BYTES - wpos
+                    ring[wpos:] = chunk[:split]
+                    ring[:end - LOG_RING_BYTES] = chunk[split:]
+                wpos = end % LOG_RING_BYTES
+                total += len(chunk)
+            if total >= LOG_RING_BYTES:
+                data = ring[wpos:] + ring[:wpos]  # unwrap: oldest surviving byte first
+            else:
+                data = ring[:wpos]
+
+    _set_log_offset(container_id, fetch_ts)
+    return data.decode("utf-8", errors="replace")
+
+# Notification batching: producers enqueue messages and a background thread
+# coalesces up to NOTIFY_BATCH_SIZE of them into a single POST, instead of one
+# HTTP request (serialize + syscall + round trip) per container per run.
+_notify_queue = queue.Queue()
+
+def _notify_worker():
+    """
+    Drains the notification queue, sending messages in coalesced batches.
+
+    Blocks for one message, then greedily collects up to NOTIFY_BATCH_SIZE
+    more within a short window so a whole burst of per-container
+    notifications travels in one request.
+    """
+    while True:
+        messages = [_notify_queue.get()]
+        while len(messages) < NOTIFY_BATCH_SIZE:
+            try:
+                messages.append(_notify_queue.get(timeout=0.05))
+            except queue.Empty:
+                break
+        try:
+            SESSION.post(NOTIFY_URL, data=orjson.dumps({"batch": messages}),
+                         headers={"Content-Type": "application/json"})
+        except requests.exceptions.RequestException as e:
+            log.error(f"Failed to send notification batch: {e}")
+        for _ in messages:
+            _notify_queue.task_done()
+
+if NOTIFY_URL is not None:
+    threading.Thread(target=_notify_worker, daemon=True).start()
 
 # Send a notification
 def send_notification(subject, message):
     """
-    Sends notifications using an external system.
+    Queues a notification for the background batch sender.
 
     Args:
         subject (str): Subject of the notification.
         message (str): Message content of the notification.
     """
-    # use dynamic-notification-system here :)
+    # uses dynamic-notification-system :)
     # https://github.com/zrougamed/dynamic-notification-system
-    # payload = {
-    #     "notification_type":"ntfy",
-    #     "message":{
-    #         "title": subject,
-    #         "message": message,
-    #         },
-    # }
-    # requests.post("http://localhost:8080/notify",data=json.dumps(payload))
-    pass 
+    if NOTIFY_URL is None:
+        return
+    _notify_queue.put({
+        "notification_type": "ntfy",
+        "message": {
+            "title": subject,
+            "message": message,
+        },
+    })
 
 # Create a container 
 # https://docs.portainer.io/api/examples#create-a-container
@@ -129,26 +388,27 @@ def create_container_from_compose(jwt_token, compose_file_content):
     Returns:
         str: Name of the created stack if successful, None otherwise.
     """
-    url = f"{PORTAINER_URL}/stacks?type=2&method=string&endpointId={ENDPOINT_ID}"
-    headers = {
-        "Authorization": f"Bearer {jwt_token}",
-        "Content-Type": "application/json"
-    }
+    url = f"{STACKS_URL}?type=2&method=string&endpointId={ENDPOINT_ID}"
 
     payload = {
-        "name": "job-stack",  # Replace with your job stack 
+        "name": "job-stack",  # Replace with your job stack
         "stackFileContent": compose_file_content
     }
 
-    response = requests.post(url, headers=headers, json=payload)
+    # Serialize with orjson instead of requests' internal json.dumps
+    response = SESSION.post(url, data=orjson.dumps(payload), headers={"Content-Type": "application/json"})
     if response.status_code == 200 or response.status_code == 201:
-        print("Container created successfully.")
-        return response.json()["Name"]
+        log.info("Container created successfully.")
+        # The listings just changed; don't serve stale cached responses
+        _stacks_cache.clear()
+        _containers_cache.clear()
+        return orjson.loads(response.content)["Name"]
     else:
-        print(f"Failed to create container: {response.text}")
+        log.error(f"Failed to create container: {response.text}")
         return None
 
 # Fetch all stacks
+@cached(_stacks_cache, lock=threading.Lock())
 def get_stacks(jwt_token):
     """
     Fetches all stacks in the Portainer instance.
@@ -159,13 +419,50 @@ def get_stacks(jwt_token):
     Returns:
         list: List of stacks in the Portainer instance.
     """
-    url = f"{PORTAINER_URL}/stacks"
-    headers = {"Authorization": f"Bearer {jwt_token}"}
-    response = requests.get(url, headers=headers)
+    url = STACKS_URL
+    response = SESSION.get(url)
+    response.raise_for_status()
+    return orjson.loads(response.content)
+
+# List every container on the endpoint
+def list_all_containers(jwt_token):
+    """
+    Fetches all containers on the endpoint in a single API call.
+
+    Cheaper than one filtered /containers/json round trip per stack: the
+    response already carries each container's labels, so callers can group
+    by stack locally.
+
+    Args:
+        jwt_token (str): JWT token for authorization.
+
+    Returns:
+        list: All containers on the endpoint.
+    """
+    url = f"{CONTAINERS_URL}/json?all=true"
+    response = SESSION.get(url)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
+
+# Group containers by the compose project label
+def group_containers_by_stack(containers):
+    """
+    Buckets containers by their com.docker.compose.project label.
+
+    Args:
+        containers (list): Containers as returned by list_all_containers.
+
+    Returns:
+        dict: Mapping of stack name to its list of containers.
+    """
+    by_stack = defaultdict(list)
+    for container in containers:
+        project = (container.get("Labels") or {}).get("com.docker.compose.project", "")
+        by_stack[project].append(container)
+    return by_stack
 
 # Get containers in a stack
+@cached(_containers_cache, lock=threading.Lock())
 def get_stack_containers(jwt_token, stack_id):
     """
     Fetches all containers in a specific stack.
@@ -177,53 +474,96 @@ def get_stack_containers(jwt_token, stack_id):
     Returns:
         list: List of containers in the stack.
     """
-    url = f"{PORTAINER_URL}/endpoints/{ENDPOINT_ID}/docker/containers/json?filters={{\"label\": [\"com.docker.compose.project={stack_id}\"]}}"
-    headers = {"Authorization": f"Bearer {jwt_token}"}
-    print(url)
-    response = requests.get(url, headers=headers)
+    # Encode the filters JSON properly so stack names with reserved or
+    # non-ASCII characters don't silently break the query string
+    query = urlencode({"filters": json.dumps({"label": [f"com.docker.compose.project={stack_id}"]})})
+    url = f"{CONTAINERS_URL}/json?{query}"
+    response = SESSION.get(url)
     response.raise_for_status()
-    return response.json()
+    return orjson.loads(response.content)
+
+# Fetch logs for several containers in parallel and notify
+def fetch_and_notify_logs(jwt_token, containers):
+    """
+    Fetches logs for a list of containers concurrently and sends them as notifications.
+
+    Log fetching is I/O-bound (waiting on the Portainer API), so the requests are
+    submitted to a thread pool and handled as they complete instead of one at a time.
+
+    Args:
+        jwt_token (str): JWT token for authorization.
+        containers (list): Containers as returned by the Portainer API.
+    """
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        futures = {
+            executor.submit(fetch_logs, jwt_token, container['Id']): container
+            for container in containers
+        }
+        for future in as_completed(futures):
+            container = futures[future]
+            container_id = container['Id']
+            logs = future.result()
+
+            log.debug(logs)
+
+            # Send logs via notification
+            send_notification(
+                subject=f"Logs for container {container_id}",
+                message=logs
+            )
+
+# Handle a single stack end to end
+def process_stack(jwt_token, stack, containers):
+    """
+    Processes one stack: fetches its containers' logs and notifies.
+
+    Designed to run on a worker thread so that independent stacks are handled
+    concurrently instead of one after another.
+
+    Args:
+        jwt_token (str): JWT token for authorization.
+        stack (dict): Stack as returned by the Portainer API.
+        containers (list): Containers belonging to the stack.
+    """
+    log.info(f"ID: {stack['Id']}, Name: {stack['Name']}")
+
+    for container in containers:
+        log.info(f"ID: {container['Id']}, Name: {container['Names'][0]}, Image: {container['Image']}")
+
+        container_id = container['Id']
+
+        # Start the container
+        # start_container(jwt_token, container_id)
+
+        # Wait for the container to initialize (polls readiness instead of a fixed sleep)
+        # wait_ready(jwt_token, container_id)
+
+    # Fetch logs for all containers in parallel and notify
+    fetch_and_notify_logs(jwt_token, containers)
 
 # Main scheduler
 if __name__ == "__main__":
     try:
-        # Authenticate and get JWT token
-        jwt_token = authenticate()
+        # Authenticate and get JWT token (cached across runs)
+        jwt_token = get_jwt()
 
-        if DEBUG:
-            print(jwt_token)
+        log.debug(jwt_token)
         
         # Fetch all stacks to identify the stack ID
         stacks = get_stacks(jwt_token)
 
-        for stack in stacks:
-            print(f"ID: {stack['Id']}, Name: {stack['Name']}")
-            stack_id = stack['Name']
-            # Fetch containers in the selected stack
-            containers = get_stack_containers(jwt_token, stack_id)
-
-            for container in containers:
-                print(f"ID: {container['Id']}, Name: {container['Names'][0]}, Image: {container['Image']}")
-
-                container_id = container['Id']
-                
-                # Start the container
-                # start_container(jwt_token, container_id)
-
-                # Wait for the container to initialize
-                # time.sleep(10)  # Adjust the sleep time based on your container's startup time
-
-                # Fetch logs
-                logs = fetch_logs(jwt_token, container_id)
+        # List every container once and bucket by stack locally, instead of
+        # one filtered /containers/json round trip per stack
+        containers_by_stack = group_containers_by_stack(list_all_containers(jwt_token))
 
-                if DEBUG:
-                    print(logs)
-
-                # Send logs via notification
-                send_notification(
-                    subject=f"Logs for container {container_id}",
-                    message=logs
-                )
+        # Process all stacks concurrently; each worker fans out again per container
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            futures = [
+                executor.submit(process_stack, jwt_token, stack, containers_by_stack[stack['Name']])
+                for stack in stacks
+            ]
+            for future in as_completed(futures):
+                future.result()
 
 
         ## Create a New Container Stack via the API 
@@ -239,28 +579,23 @@ services:
         # Create the container
         stack_id = create_container_from_compose(jwt_token, docker_compose_content)
         if stack_id is not None:
-            print(f"ID: {stack['Id']}, Name: {stack['Name']}")
-            
+            log.info(f"Created stack: {stack_id}")
+
+
             # Fetch containers in the selected stack
             containers = get_stack_containers(jwt_token, stack_id)
 
             for container in containers:
-                print(f"ID: {container['Id']}, Name: {container['Names'][0]}, Image: {container['Image']}")
-
-                container_id = container['Id']
-                
-                logs = fetch_logs(jwt_token, container_id)
-
-                if DEBUG:
-                    print(logs)
+                log.info(f"ID: {container['Id']}, Name: {container['Names'][0]}, Image: {container['Image']}")
 
-                # Send logs via notification
-                send_notification(
-                    subject=f"Logs for container {container_id}",
-                    message=logs
-                )
+            # Fetch logs for all containers in parallel and notify
+            fetch_and_notify_logs(jwt_token, containers)
 
     except requests.exceptions.RequestException as e:
-        print(f"An error occurred: {e}")
+        log.error(f"An error occurred: {e}")
     except Exception as e:
-        print(f"Unexpected error: {e}")
+        log.error(f"Unexpected error: {e}")
+    finally:
+        if NOTIFY_URL is not None:
+            _notify_queue.join()  # wait for queued notifications to go out
+        _log_listener.stop()  # drain queued records before exit